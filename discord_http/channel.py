@@ -58,7 +58,7 @@ class PartialChannel(PartialBase):
         id: int,
         guild_id: Optional[int] = None
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
         self.guild_id: Optional[int] = guild_id
 
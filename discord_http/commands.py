@@ -167,7 +167,7 @@ class Cog:
 
 class PartialCommand(PartialBase):
     def __init__(self, data: dict):
-        super().__init__(id=int(data["id"]))
+        super().__init__(id=data["id"])
         self.name: str = data["name"]
         self.guild_id: Optional[int] = utils.get_int(data, "guild_id")
 
@@ -118,7 +118,7 @@ class PartialEmoji(PartialBase):
         id: int,
         guild_id: Optional[int] = None,
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
         self.id: int = id
@@ -26,7 +26,7 @@ class PartialSKU(PartialBase):
         state: "DiscordAPI",
         id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
     def __repr__(self) -> str:
@@ -102,7 +102,7 @@ class PartialEntitlements(PartialBase):
         state: "DiscordAPI",
         id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
     def __repr__(self) -> str:
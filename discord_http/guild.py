@@ -58,7 +58,7 @@ class PartialScheduledEvent(PartialBase):
         id: int,
         guild_id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self.guild_id: int = guild_id
 
         self._state = state
@@ -270,7 +270,7 @@ class ScheduledEvent(PartialScheduledEvent):
 
 class PartialGuild(PartialBase):
     def __init__(self, *, state: "DiscordAPI", id: int):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
     def __repr__(self) -> str:
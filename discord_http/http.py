@@ -113,6 +113,17 @@ async def query(
     `HTTPResponse`
         The response from the request
     """
+    if "json" in kwargs:
+        # Encode the payload once here with compact separators,
+        # instead of letting aiohttp run the default json.dumps per request
+        kwargs["data"] = json.dumps(
+            kwargs.pop("json"),
+            separators=(",", ":")
+        ).encode("utf-8")
+        kwargs.setdefault("headers", {}).setdefault(
+            "Content-Type", "application/json"
+        )
+
     session = aiohttp.ClientSession()
 
     if not res_method:
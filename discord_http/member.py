@@ -1,18 +1,15 @@
+import asyncio
+
 from datetime import datetime, timedelta
 from typing import Union, TYPE_CHECKING, Optional
 
 from . import utils
 from .asset import Asset
-from .embeds import Embed
-from .file import File
 from .flag import Permissions, PublicFlags, GuildMemberFlags
 from .guild import PartialGuild
-from .mentions import AllowedMentions
 from .object import PartialBase, Snowflake
-from .response import ResponseType
-from .role import PartialRole, Role
+from .role import PartialRole
 from .user import User, PartialUser
-from .view import View
 
 MISSING = utils.MISSING
 
@@ -29,6 +26,8 @@ __all__ = (
 
 
 class PartialMember(PartialBase):
+    __slots__ = ("_state", "_user", "_guild", "_mention", "guild_id")
+
     def __init__(
         self,
         *,
@@ -36,19 +35,29 @@ class PartialMember(PartialBase):
         id: int,
         guild_id: int,
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
-        self._user = PartialUser(state=state, id=self.id)
+        self._user: Optional[PartialUser] = None
+        self._guild: Optional[PartialGuild] = None
+        self._mention: Optional[str] = None
         self.guild_id: int = int(guild_id)
 
     def __repr__(self) -> str:
         return f"<PartialMember id={self.id} guild_id={self.guild_id}>"
 
+    def _get_user(self) -> PartialUser:
+        """ `PartialUser`: The user tied to the member, created on demand """
+        if self._user is None:
+            self._user = PartialUser(state=self._state, id=self.id)
+        return self._user
+
     @property
     def guild(self) -> PartialGuild:
         """ `PartialGuild`: The guild of the member """
-        return PartialGuild(state=self._state, id=self.guild_id)
+        if self._guild is None:
+            self._guild = PartialGuild(state=self._state, id=self.guild_id)
+        return self._guild
 
     async def fetch(self) -> "Member":
         """ `Fetch`: Fetches the member from the API """
@@ -63,67 +72,23 @@ class PartialMember(PartialBase):
             data=r.response
         )
 
-    async def send(
-        self,
-        content: Optional[str] = MISSING,
-        *,
-        channel_id: Optional[int] = MISSING,
-        embed: Optional[Embed] = MISSING,
-        embeds: Optional[list[Embed]] = MISSING,
-        file: Optional[File] = MISSING,
-        files: Optional[list[File]] = MISSING,
-        view: Optional[View] = MISSING,
-        tts: Optional[bool] = False,
-        type: Union[ResponseType, int] = 4,
-        allowed_mentions: Optional[AllowedMentions] = MISSING,
-    ) -> "Message":
+    async def send(self, *args, **kwargs) -> "Message":
         """
         Send a message to the user
 
-        Parameters
-        ----------
-        content: `Optional[str]`
-            Content of the message
-        channel_id: `Optional[int]`
-            Channel ID of the user, leave empty to create a DM
-        embed: `Optional[Embed]`
-            Embed of the message
-        embeds: `Optional[list[Embed]]`
-            Embeds of the message
-        file: `Optional[File]`
-            File of the message
-        files: `Optional[Union[list[File], File]]`
-            Files of the message
-        view: `Optional[View]`
-            Components to add to the message
-        tts: `Optional[bool]`
-            Whether the message should be sent as TTS
-        type: `Optional[ResponseType]`
-            Type of the message
-        allowed_mentions: `Optional[AllowedMentions]`
-            Allowed mentions of the message
+        Shortcut for `PartialUser.send`,
+        which also documents the parameters
 
         Returns
         -------
         `Message`
             The message sent
         """
-        return await self._user.send(
-            content,
-            channel_id=channel_id,
-            embed=embed,
-            embeds=embeds,
-            file=file,
-            files=files,
-            view=view,
-            tts=tts,
-            type=type,
-            allowed_mentions=allowed_mentions
-        )
+        return await self._get_user().send(*args, **kwargs)
 
     async def create_dm(self) -> "DMChannel":
         """ `DMChannel`: Create a DM channel with the user """
-        return await self._user.create_dm()
+        return await self._get_user().create_dm()
 
     async def ban(
         self,
@@ -156,12 +121,12 @@ class PartialMember(PartialBase):
             raise ValueError("Cannot specify both delete_message_days and delete_message_seconds")
 
         if delete_message_days:
-            if delete_message_days not in range(0, 8):
+            if not 0 <= delete_message_days <= 7:
                 raise ValueError("delete_message_days must be between 0 and 7")
-            payload["delete_message_seconds"] = int(timedelta(days=delete_message_days).total_seconds())
+            payload["delete_message_seconds"] = delete_message_days * 86400
 
         if delete_message_seconds:
-            if delete_message_seconds not in range(0, 604801):
+            if not 0 <= delete_message_seconds <= 604800:
                 raise ValueError("delete_message_seconds must be between 0 and 604,800")
             payload["delete_message_seconds"] = delete_message_seconds
 
@@ -257,11 +222,11 @@ class PartialMember(PartialBase):
 
         if nick is not MISSING:
             payload["nick"] = nick
-        if isinstance(roles, list) and roles is not MISSING:
-            payload["roles"] = [
-                role.id if isinstance(role, (PartialRole, Role)) else role
-                for role in roles
-            ]
+        if roles is not MISSING:
+            payload["roles"] = (
+                [getattr(role, "id", role) for role in roles]
+                if roles is not None else None
+            )
         if mute is not MISSING:
             payload["mute"] = mute
         if deaf is not MISSING:
@@ -290,68 +255,128 @@ class PartialMember(PartialBase):
             data=r.response
         )
 
+    def _current_role_ids(self) -> Optional[set[int]]:
+        """ `Optional[set[int]]`: The member's role IDs, if they are known """
+        role_ids: Optional[tuple[int, ...]] = getattr(self, "_role_ids", None)
+        if role_ids is None:
+            return None
+        return set(role_ids)
+
     async def add_roles(
         self,
         *roles: Union[PartialRole, int],
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        current_roles: Optional[set[int]] = None
     ) -> None:
         """
         Add roles to someone
 
+        If the member's current roles are known (either because `self` is a
+        full `Member` or `current_roles` is provided), this is done in a
+        single request, otherwise one request is made per role.
+
         Parameters
         ----------
         *roles: `Union[PartialRole, int]`
             Roles to add to the member
         reason: `Optional[str]`
             The reason for adding the roles
-
-        Parameters
-        ----------
-        reason: `Optional[str]`
-            The reason for adding the roles
+        current_roles: `Optional[set[int]]`
+            The role IDs the member currently has,
+            used to add all roles in a single request
         """
-        for role in roles:
-            if isinstance(role, PartialRole):
-                role = role.id
+        role_ids = [
+            getattr(role, "id", role)
+            for role in roles
+        ]
 
+        if current_roles is None:
+            current_roles = self._current_role_ids()
+
+        if current_roles is not None:
             await self._state.query(
+                "PATCH",
+                f"/guilds/{self.guild_id}/members/{self.id}",
+                json={"roles": sorted(current_roles | set(role_ids))},
+                reason=reason
+            )
+            return
+
+        # Per-role requests are independent, so dispatch
+        # them concurrently (the order they apply in is not guaranteed)
+        await asyncio.gather(*[
+            self._state.query(
                 "PUT",
-                f"/guilds/{self.guild_id}/members/{self.id}/roles/{role}",
+                f"/guilds/{self.guild_id}/members/{self.id}/roles/{role_id}",
                 reason=reason
             )
+            for role_id in role_ids
+        ])
 
     async def remove_roles(
         self,
         *roles: Union[PartialRole, int],
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        current_roles: Optional[set[int]] = None
     ) -> None:
         """
         Remove roles from someone
 
+        If the member's current roles are known (either because `self` is a
+        full `Member` or `current_roles` is provided), this is done in a
+        single request, otherwise one request is made per role.
+
         Parameters
         ----------
+        *roles: `Union[PartialRole, int]`
+            Roles to remove from the member
         reason: `Optional[str]`
             The reason for removing the roles
+        current_roles: `Optional[set[int]]`
+            The role IDs the member currently has,
+            used to remove all roles in a single request
         """
-        for role in roles:
-            if isinstance(role, PartialRole):
-                role = role.id
+        role_ids = [
+            getattr(role, "id", role)
+            for role in roles
+        ]
 
+        if current_roles is None:
+            current_roles = self._current_role_ids()
+
+        if current_roles is not None:
             await self._state.query(
+                "PATCH",
+                f"/guilds/{self.guild_id}/members/{self.id}",
+                json={"roles": sorted(current_roles - set(role_ids))},
+                reason=reason
+            )
+            return
+
+        # Per-role requests are independent, so dispatch
+        # them concurrently (the order they apply in is not guaranteed)
+        await asyncio.gather(*[
+            self._state.query(
                 "DELETE",
-                f"/guilds/{self.guild_id}/members/{self.id}/roles/{role}",
+                f"/guilds/{self.guild_id}/members/{self.id}/roles/{role_id}",
                 reason=reason
             )
+            for role_id in role_ids
+        ])
 
     @property
     def mention(self) -> str:
         """ `str`: The mention of the member """
-        return f"<@!{self.id}>"
+        if self._mention is None:
+            self._mention = f"<@{self.id}>"
+        return self._mention
 
 
 class ThreadMember(PartialBase):
+    __slots__ = ("_state", "flags", "join_timestamp")
+
     def __init__(self, *, state: "DiscordAPI", data: dict):
-        super().__init__(id=int(data["user_id"]))
+        super().__init__(id=data["user_id"])
         self._state = state
 
         self.flags: int = data["flags"]
@@ -365,6 +390,11 @@ class ThreadMember(PartialBase):
 
 
 class Member(PartialMember):
+    __slots__ = (
+        "avatar", "flags", "pending", "_raw_permissions",
+        "nick", "joined_at", "_role_ids", "_roles",
+    )
+
     def __init__(
         self,
         *,
@@ -379,20 +409,23 @@ class Member(PartialMember):
         )
 
         self._user = User(state=state, data=data["user"])
+        self._guild = guild
 
-        self.avatar: Optional[Asset] = None
+        avatar_hash = data.get("avatar", None)
+        self.avatar: Optional[Asset] = (
+            Asset._from_guild_avatar(self.guild_id, self.id, avatar_hash)
+            if avatar_hash else None
+        )
 
         self.flags: GuildMemberFlags = GuildMemberFlags(data["flags"])
         self.pending: bool = data.get("pending", False)
         self._raw_permissions: Optional[int] = utils.get_int(data, "permissions")
         self.nick: Optional[str] = data.get("nick", None)
         self.joined_at: datetime = utils.parse_time(data["joined_at"])
-        self.roles: list[PartialRole] = [
-            PartialRole(state=state, id=int(r), guild_id=self.guild.id)
-            for r in data["roles"]
-        ]
-
-        self._from_data(data)
+        self._role_ids: tuple[int, ...] = tuple(
+            int(r) for r in data["roles"]
+        )
+        self._roles: Optional[list[PartialRole]] = None
 
     def __repr__(self) -> str:
         return (
@@ -403,12 +436,15 @@ class Member(PartialMember):
     def __str__(self) -> str:
         return str(self._user)
 
-    def _from_data(self, data: dict) -> None:
-        has_avatar = data.get("avatar", None)
-        if has_avatar:
-            self.avatar = Asset._from_guild_avatar(
-                self.guild.id, self.id, has_avatar
-            )
+    @property
+    def roles(self) -> list[PartialRole]:
+        """ `list[PartialRole]`: The roles of the member """
+        if self._roles is None:
+            self._roles = [
+                PartialRole(state=self._state, id=r, guild_id=self.guild_id)
+                for r in self._role_ids
+            ]
+        return self._roles
 
     def get_role(
         self,
@@ -1,4 +1,4 @@
-from typing import Union, Optional, Self
+from typing import Union, Optional
 
 from .object import Snowflake
 
@@ -8,6 +8,11 @@ __all__ = (
 
 
 class AllowedMentions:
+    __slots__ = (
+        "everyone", "users", "roles", "reply_user",
+        "_users_ids", "_roles_ids", "_cached_dict",
+    )
+
     def __init__(
         self,
         *,
@@ -21,39 +26,75 @@ class AllowedMentions:
         self.roles: Optional[Union[bool, list[Union[Snowflake, int]]]] = roles
         self.reply_user: bool = replied_user
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+
+        # Normalize users/roles once on assignment, so to_dict does not
+        # have to re-check the types on every outgoing message, and drop
+        # the cached payload whenever a public attribute changes
+        if name == "users":
+            object.__setattr__(self, "_users_ids", (
+                tuple(int(x) for x in value)
+                if isinstance(value, list) else None
+            ))
+        elif name == "roles":
+            object.__setattr__(self, "_roles_ids", (
+                tuple(int(x) for x in value)
+                if isinstance(value, list) else None
+            ))
+
+        if name in ("everyone", "users", "roles", "reply_user"):
+            object.__setattr__(self, "_cached_dict", None)
+
     @classmethod
-    def all(cls) -> Self:
-        """ `AllowedMentions`: Preset to allow all mentions """
-        return cls(everyone=True, roles=True, users=True, replied_user=True)
+    def all(cls) -> "AllowedMentions":
+        """
+        `AllowedMentions`: Preset to allow all mentions
+
+        The preset is a shared instance and should not be mutated
+        """
+        return _ALL
 
     @classmethod
-    def none(cls) -> Self:
-        """ `AllowedMentions`: Preset to deny any mentions """
-        return cls(everyone=False, roles=False, users=False, replied_user=False)
+    def none(cls) -> "AllowedMentions":
+        """
+        `AllowedMentions`: Preset to deny any mentions
+
+        The preset is a shared instance and should not be mutated
+        """
+        return _NONE
 
     def to_dict(self) -> dict:
         """
         `dict`: Representation of the `AllowedMentions`
         that is Discord API friendly
         """
-        parse = []
-        data = {}
+        if self._cached_dict is None:
+            parse = []
+
+            if self.everyone:
+                parse.append("everyone")
+            if self._users_ids is None and self.users is True:
+                parse.append("users")
+            if self._roles_ids is None and self.roles is True:
+                parse.append("roles")
 
-        if self.everyone:
-            parse.append("everyone")
+            # Cached with immutable values, since most bots reuse the
+            # same AllowedMentions for every message they send
+            self._cached_dict = {
+                **({"users": self._users_ids} if self._users_ids is not None else {}),
+                **({"roles": self._roles_ids} if self._roles_ids is not None else {}),
+                **({"replied_user": True} if self.reply_user else {}),
+                "parse": tuple(parse)
+            }
 
-        if isinstance(self.users, list):
-            data["users"] = [int(x) for x in self.users]
-        elif self.users is True:
-            parse.append("users")
+        return self._cached_dict.copy()
 
-        if isinstance(self.roles, list):
-            data["roles"] = [int(x) for x in self.roles]
-        elif self.roles is True:
-            parse.append("roles")
 
-        if self.reply_user:
-            data["replied_user"] = True
+_ALL = AllowedMentions(everyone=True, users=True, roles=True, replied_user=True)
+_NONE = AllowedMentions(everyone=False, users=False, roles=False, replied_user=False)
 
-        data["parse"] = parse
-        return data
+# Warm the payload cache of the shared presets at import,
+# so their first message send does not have to build it
+_ALL.to_dict()
+_NONE.to_dict()
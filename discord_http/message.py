@@ -553,7 +553,7 @@ class PartialMessage(PartialBase):
         id: int,
         channel_id: int,
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
         self.channel_id: int = int(channel_id)
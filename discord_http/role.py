@@ -26,7 +26,7 @@ class PartialRole(PartialBase):
         id: int,
         guild_id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
         self.guild_id: int = guild_id
 
@@ -25,7 +25,7 @@ class PartialSticker(PartialBase):
         name: Optional[str] = None,
         guild_id: Optional[int] = None
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
         self.name: Optional[str] = name
@@ -31,7 +31,7 @@ class PartialUser(PartialBase):
         state: "DiscordAPI",
         id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
 
     def __repr__(self) -> str:
@@ -256,29 +256,27 @@ def add_to_datetime(
     `TypeError`
         Invalid type for timestamp provided
     """
-    match ts:
-        case x if isinstance(x, datetime):
-            if x.tzinfo is None:
-                raise ValueError(
-                    "datetime object must be timezone aware"
-                )
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            raise ValueError(
+                "datetime object must be timezone aware"
+            )
 
-            if x.tzinfo is timezone.utc:
-                return x
+        if ts.tzinfo is timezone.utc:
+            return ts
 
-            return x.astimezone(timezone.utc)
+        return ts.astimezone(timezone.utc)
 
-        case x if isinstance(x, timedelta):
-            return utcnow() + x
+    elif isinstance(ts, timedelta):
+        return utcnow() + ts
 
-        case x if isinstance(x, int):
-            return utcnow() + timedelta(seconds=x)
+    elif isinstance(ts, int):
+        return utcnow() + timedelta(seconds=ts)
 
-        case _:
-            raise TypeError(
-                "Invalid type for timestamp, expected "
-                f"datetime, timedelta or int, got {type(ts)} instead"
-            )
+    raise TypeError(
+        "Invalid type for timestamp, expected "
+        f"datetime, timedelta or int, got {type(ts)} instead"
+    )
 
 
 def mime_type_image(image: bytes) -> str:
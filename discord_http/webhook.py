@@ -33,7 +33,7 @@ class PartialWebhook(PartialBase):
         id: int,
         token: Optional[str] = None
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
         self.token: Optional[str] = token
 